@@ -0,0 +1,71 @@
+"""
+Measures what one worker pays to import app.py: wall time and resident memory.
+
+    python bench_startup.py --runs 5
+    python bench_startup.py --runs 5 --warm    # also load Gemini, Razorpay and OAuth
+
+Each run imports the app in a fresh interpreter (as a gunicorn worker without
+preload would), so it needs the same environment as the app itself (.env, database).
+--warm forces the lazily loaded integrations, which shows what they add on top
+of a cold worker.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = r'''
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter() - started
+if WARM:
+    started = time.perf_counter()
+    app.gemini_model(); app.razorpay_client(); app.google_oauth()
+    warmed = time.perf_counter() - started
+else:
+    warmed = 0.0
+
+def rss_kib():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({'import_s': imported, 'warm_s': warmed, 'rss_kib': rss_kib(), 'modules': len(sys.modules)}))
+'''
+
+
+def run_once(warm):
+    env = dict(os.environ, APP_PRELOAD='1', MAIL_OUTBOX_WORKER='false')
+    result = subprocess.run(
+        [sys.executable, '-c', f'WARM = {warm!r}\n' + PROBE],
+        cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--warm', action='store_true', help='also initialise the lazy integrations')
+    args = parser.parse_args()
+
+    samples = [run_once(args.warm) for _ in range(args.runs)]
+    median = lambda key: statistics.median(s[key] for s in samples)
+    print(f"{args.runs} fresh imports of app.py ({'warm' if args.warm else 'cold'} integrations)")
+    print(f"import time: median {median('import_s') * 1000:.0f} ms, "
+          f"min {min(s['import_s'] for s in samples) * 1000:.0f} ms")
+    if args.warm:
+        print(f"integration init: median {median('warm_s') * 1000:.0f} ms")
+    print(f"RSS per worker: median {median('rss_kib') / 1024:.1f} MiB")
+    print(f"modules loaded: {int(median('modules'))}")
+
+
+if __name__ == '__main__':
+    main()
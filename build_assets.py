@@ -0,0 +1,112 @@
+"""
+Fingerprints everything under static/ into static/dist/ for long-lived caching.
+
+    python build_assets.py
+
+Each asset is copied to static/dist/<path>/<name>.<hash>.<ext>, CSS url(...) references
+are rewritten to the hashed names, text assets get precompressed .gz / .br siblings, and
+static/dist/manifest.json maps "css/style.css" -> "dist/css/style.1a2b3c4d5e.css".
+app.py reads the manifest (asset_url) and serves dist/ files as immutable.
+Run it again after changing any asset; it needs neither the app nor the database.
+"""
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+import sys
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_DIR = 'dist'
+MANIFEST = 'manifest.json'
+
+# Runtime uploads change after deploy, so they are served as-is
+SKIP_DIRS = {DIST_DIR, posixpath.join('images', 'products')}
+ASSET_EXTENSIONS = {
+    '.css', '.js', '.svg', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico',
+    '.woff', '.woff2', '.ttf', '.eot', '.json', '.txt',
+}
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.ico', '.json', '.txt', '.ttf', '.eot'}
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def collect_assets(static_dir):
+    """Logical paths (posix, relative to static/) of every asset to fingerprint."""
+    assets = []
+    for root, dirs, files in os.walk(static_dir):
+        rel_root = os.path.relpath(root, static_dir).replace(os.sep, '/')
+        rel_root = '' if rel_root == '.' else rel_root
+        dirs[:] = [d for d in dirs if posixpath.join(rel_root, d) not in SKIP_DIRS]
+        for name in files:
+            if os.path.splitext(name)[1].lower() in ASSET_EXTENSIONS:
+                assets.append(posixpath.join(rel_root, name))
+    # CSS last, so the files it references are already hashed when it is rewritten
+    return sorted(assets, key=lambda path: (path.endswith('.css'), path))
+
+
+def rewrite_css_urls(css, css_path, manifest):
+    """Points relative url(...) references at the hashed copies."""
+    base = posixpath.dirname(css_path)
+
+    def replace(match):
+        quote, ref = match.groups()
+        if ref.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        path, _, suffix = ref.partition('?')
+        target = posixpath.normpath(posixpath.join(base, path))
+        hashed = manifest.get(target)
+        if not hashed:
+            return match.group(0)
+        new_ref = posixpath.relpath(hashed, posixpath.join(DIST_DIR, base))
+        return f"url({quote}{new_ref}{'?' + suffix if suffix else ''}{quote})"
+
+    return CSS_URL.sub(replace, css)
+
+
+def precompress(path, data):
+    """Writes .gz (and .br when the brotli package is installed) if they are smaller."""
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        with open(path + '.gz', 'wb') as f:
+            f.write(gz)
+    try:
+        import brotli
+    except ImportError:
+        return
+    br = brotli.compress(data, quality=11)
+    if len(br) < len(data):
+        with open(path + '.br', 'wb') as f:
+            f.write(br)
+
+
+def build(static_dir=STATIC_DIR):
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    manifest = {}
+
+    for logical in collect_assets(static_dir):
+        with open(os.path.join(static_dir, logical), 'rb') as f:
+            data = f.read()
+        if logical.endswith('.css'):
+            data = rewrite_css_urls(data.decode('utf-8'), logical, manifest).encode('utf-8')
+
+        stem, ext = posixpath.splitext(logical)
+        hashed = posixpath.join(DIST_DIR, f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}")
+        target = os.path.join(static_dir, *hashed.split('/'))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+        if ext.lower() in COMPRESSIBLE_EXTENSIONS:
+            precompress(target, data)
+        manifest[logical] = hashed
+
+    with open(os.path.join(dist_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+if __name__ == '__main__':
+    manifest = build(sys.argv[1] if len(sys.argv) > 1 else STATIC_DIR)
+    print(f"Fingerprinted {len(manifest)} assets into static/{DIST_DIR}/")
@@ -0,0 +1,78 @@
+"""
+Gunicorn settings for the production container. Every value can be overridden
+through the environment, e.g. WEB_CONCURRENCY=4 GUNICORN_THREADS=8.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+# Tell app.py that it is being preloaded in the master (see post_fork)
+os.environ.setdefault('APP_PRELOAD', '1')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Processes x threads: threads cover requests that wait on Postgres, Razorpay, SMTP or a
+# streamed Gemini reply (SSE), processes cover CPU-bound template rendering.
+workers = int(os.getenv('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+# Import app.py once in the master: faster boot and copy-on-write shared memory
+preload_app = True
+
+# Recycle workers periodically so slow leaks cannot grow without bound
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+# Streamed chat replies may take up to GEMINI_STREAM_DEADLINE (45s) seconds
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))  # finish in-flight requests on SIGTERM
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))                  # behind nginx
+
+# Heartbeat files on tmpfs: avoids worker stalls on slow container filesystems
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Workers write their metrics here so /metrics can aggregate all of them (prometheus_client
+# multiprocess mode). Must be set before app.py is imported, i.e. here rather than in the app.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(worker_tmp_dir or tempfile.gettempdir(), 'prometheus'))
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    """Drops metric files left by a previous run, so counters start from zero."""
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Stops reporting live gauges of a worker that exited (counters are kept)."""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    """Per-worker setup for state created while preloading in the master."""
+    from app import app, db, ensure_outbox_worker
+
+    # Connections opened in the master (create_all, admin check) must not be shared;
+    # that includes the reports bind (always configured) and the replica
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    ensure_outbox_worker()
+
+
+def post_worker_init(worker):
+    """Logs each worker's resident memory once it is ready to serve (see bench_startup.py)."""
+    try:
+        with open('/proc/self/status') as f:
+            rss = next(line.split()[1] for line in f if line.startswith('VmRSS:'))
+        worker.log.info("Worker %s ready, RSS %.1f MiB", worker.pid, int(rss) / 1024)
+    except (OSError, StopIteration):
+        pass
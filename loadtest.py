@@ -0,0 +1,76 @@
+"""
+Small closed-loop HTTP load generator (standard library only).
+
+    python loadtest.py http://localhost:5000/ --concurrency 32 --duration 20
+
+Run it once against the development server (`python app.py`) and once against
+gunicorn (`gunicorn -c gunicorn.conf.py wsgi:application`) to compare throughput
+and latency. Several URLs may be given; each client cycles through them.
+"""
+import argparse
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def worker(urls, deadline, timeout, results, lock):
+    latencies, errors, i = [], 0, 0
+    while time.monotonic() < deadline:
+        url = urls[i % len(urls)]
+        i += 1
+        started = time.monotonic()
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                response.read()
+            latencies.append(time.monotonic() - started)
+        except (urllib.error.URLError, OSError):
+            errors += 1
+    with lock:
+        results['latencies'].extend(latencies)
+        results['errors'] += errors
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--concurrency', '-c', type=int, default=16)
+    parser.add_argument('--duration', '-d', type=float, default=15, help='seconds')
+    parser.add_argument('--timeout', type=float, default=30, help='per request, seconds')
+    args = parser.parse_args()
+
+    results = {'latencies': [], 'errors': 0}
+    lock = threading.Lock()
+    started = time.monotonic()
+    deadline = started + args.duration
+    threads = [
+        threading.Thread(target=worker, args=(args.urls, deadline, args.timeout, results, lock))
+        for _ in range(args.concurrency)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - started
+
+    latencies = sorted(results['latencies'])
+    print(f"{len(latencies)} ok, {results['errors']} errors in {elapsed:.1f}s "
+          f"with {args.concurrency} clients")
+    if latencies:
+        print(f"throughput: {len(latencies) / elapsed:.1f} req/s")
+        print("latency ms: mean {:.1f}  p50 {:.1f}  p95 {:.1f}  p99 {:.1f}  max {:.1f}".format(
+            statistics.mean(latencies) * 1000,
+            percentile(latencies, 0.50) * 1000,
+            percentile(latencies, 0.95) * 1000,
+            percentile(latencies, 0.99) * 1000,
+            latencies[-1] * 1000,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""product search indexes
+
+Revision ID: 3f1c9a7be2d4
+Revises:
+Create Date: 2026-10-18 10:12:41.508311
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7be2d4'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Must stay identical to SEARCH_DOCUMENT_SQL / SEARCH_TEXT_SQL in app.py,
+# otherwise search_products() cannot use these indexes.
+SEARCH_DOCUMENT_SQL = (
+    "(setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(category, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(ingredients, '') || ' ' || coalesce(best_with, '')), 'C'))"
+)
+SEARCH_TEXT_SQL = (
+    "(lower(coalesce(name, '') || ' ' || coalesce(category, '') || ' ' || "
+    "coalesce(ingredients, '') || ' ' || coalesce(best_with, '')))"
+)
+
+
+def upgrade():
+    # tsvector / pg_trgm are Postgres-only; other databases use the ILIKE fallback
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY cannot run inside a transaction, and keeps the table writable while building
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_search_document "
+            f"ON products USING gin ({SEARCH_DOCUMENT_SQL})"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_search_text_trgm "
+            f"ON products USING gin ({SEARCH_TEXT_SQL} gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_search_text_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_search_document")
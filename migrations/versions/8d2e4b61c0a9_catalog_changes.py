@@ -0,0 +1,34 @@
+"""catalog changes log
+
+Revision ID: 8d2e4b61c0a9
+Revises: 3f1c9a7be2d4
+Create Date: 2026-10-18 11:40:03.117452
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e4b61c0a9'
+down_revision = '3f1c9a7be2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # app.py runs db.create_all() on import, so the table may already exist
+    if sa.inspect(op.get_bind()).has_table('catalog_changes'):
+        return
+
+    op.create_table(
+        'catalog_changes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('created', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('catalog_changes')
@@ -0,0 +1,34 @@
+"""payment razorpay id
+
+Revision ID: a4e7c2b9d315
+Revises: f3c8a1d6e047
+Create Date: 2026-10-18 19:12:44.103587
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e7c2b9d315'
+down_revision = 'f3c8a1d6e047'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing payments keep NULL (unique constraints allow any number of NULLs)
+    inspector = sa.inspect(op.get_bind())
+    columns = {c['name'] for c in inspector.get_columns('payments')}
+    constraints = {c['name'] for c in inspector.get_unique_constraints('payments')}
+    with op.batch_alter_table('payments') as batch_op:
+        if 'razorpay_payment_id' not in columns:
+            batch_op.add_column(sa.Column('razorpay_payment_id', sa.String(length=64), nullable=True))
+        if 'uq_payments_razorpay_payment_id' not in constraints:
+            batch_op.create_unique_constraint('uq_payments_razorpay_payment_id', ['razorpay_payment_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('payments') as batch_op:
+        batch_op.drop_constraint('uq_payments_razorpay_payment_id', type_='unique')
+        batch_op.drop_column('razorpay_payment_id')
@@ -0,0 +1,57 @@
+"""daily sales rollup
+
+Revision ID: a93f6c2d58e1
+Revises: e5b08f3a71c2
+Create Date: 2026-10-18 15:02:37.264190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a93f6c2d58e1'
+down_revision = 'e5b08f3a71c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # app.py runs db.create_all() on import, so the table may already exist
+    if not sa.inspect(op.get_bind()).has_table('daily_sales'):
+        op.create_table(
+            'daily_sales',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('day', sa.Date(), nullable=False),
+            sa.Column('status', sa.String(length=50), nullable=False),
+            sa.Column('product_id', sa.Integer(), nullable=False),
+            sa.Column('revenue', sa.Float(), nullable=False),
+            sa.Column('quantity', sa.Integer(), nullable=False),
+            sa.Column('order_count', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('day', 'status', 'product_id', name='uq_daily_sales_day_status_product')
+        )
+
+    # Same backfill as `flask backfill-daily-sales`
+    op.execute("DELETE FROM daily_sales")
+    op.execute("""
+        INSERT INTO daily_sales (day, status, product_id, revenue, quantity, order_count)
+        SELECT CAST(o.created AS DATE), o.status, 0,
+               COALESCE(SUM(o.total), 0), COALESCE(SUM(o.quantity), 0), COUNT(o.id)
+        FROM orders o
+        WHERE o.created IS NOT NULL
+        GROUP BY CAST(o.created AS DATE), o.status
+    """)
+    op.execute("""
+        INSERT INTO daily_sales (day, status, product_id, revenue, quantity, order_count)
+        SELECT CAST(o.created AS DATE), o.status, oi.product_id,
+               SUM(oi.total), SUM(oi.quantity), COUNT(DISTINCT o.id)
+        FROM order_items oi
+        JOIN orders o ON o.id = oi.order_id
+        WHERE o.created IS NOT NULL
+        GROUP BY CAST(o.created AS DATE), o.status, oi.product_id
+    """)
+
+
+def downgrade():
+    op.drop_table('daily_sales')
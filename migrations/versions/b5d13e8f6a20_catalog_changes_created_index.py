@@ -0,0 +1,37 @@
+"""catalog changes created index
+
+Revision ID: b5d13e8f6a20
+Revises: a4e7c2b9d315
+Create Date: 2026-10-18 19:48:27.551036
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d13e8f6a20'
+down_revision = 'a4e7c2b9d315'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the overlap-window re-read in SuggestIndex.sync and prune_catalog_changes
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_catalog_changes_created ON catalog_changes (created)")
+        return
+
+    existing = {ix['name'] for ix in sa.inspect(op.get_bind()).get_indexes('catalog_changes')}
+    if 'ix_catalog_changes_created' not in existing:
+        op.create_index('ix_catalog_changes_created', 'catalog_changes', ['created'])
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_catalog_changes_created")
+        return
+
+    op.drop_index('ix_catalog_changes_created', table_name='catalog_changes')
@@ -0,0 +1,130 @@
+"""carts and order items
+
+Moves cart lines (orders with status 'Pending') into carts / cart_items and
+gives every remaining order its order_items line.
+
+Revision ID: c47a1e5d9b30
+Revises: 8d2e4b61c0a9
+Create Date: 2026-10-18 13:05:52.640918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47a1e5d9b30'
+down_revision = '8d2e4b61c0a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # app.py runs db.create_all() on import, so the new tables may already exist
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('carts'):
+        op.create_table(
+            'carts',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('created', sa.DateTime(), nullable=True),
+            sa.Column('updated', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id')
+        )
+
+    if not inspector.has_table('cart_items'):
+        op.create_table(
+            'cart_items',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('cart_id', sa.Integer(), nullable=False),
+            sa.Column('product_id', sa.Integer(), nullable=False),
+            sa.Column('quantity', sa.Integer(), nullable=False),
+            sa.Column('created', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['cart_id'], ['carts.id']),
+            sa.ForeignKeyConstraint(['product_id'], ['products.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('cart_id', 'product_id', name='uq_cart_items_cart_product')
+        )
+
+    if not inspector.has_table('order_items'):
+        op.create_table(
+            'order_items',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('order_id', sa.Integer(), nullable=False),
+            sa.Column('product_id', sa.Integer(), nullable=False),
+            sa.Column('quantity', sa.Integer(), nullable=False),
+            sa.Column('unit_price', sa.Float(), nullable=False),
+            sa.Column('total', sa.Float(), nullable=False),
+            sa.ForeignKeyConstraint(['order_id'], ['orders.id']),
+            sa.ForeignKeyConstraint(['product_id'], ['products.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    # New multi-item orders keep their lines in order_items only
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.alter_column('product_id', existing_type=sa.Integer(), nullable=True)
+
+    # 1. One cart per user that has 'Pending' (in-cart) orders
+    op.execute("""
+        INSERT INTO carts (user_id, created, updated)
+        SELECT o.user_id, MIN(o.created), CURRENT_TIMESTAMP
+        FROM orders o
+        WHERE o.status = 'Pending'
+          AND NOT EXISTS (SELECT 1 FROM carts c WHERE c.user_id = o.user_id)
+        GROUP BY o.user_id
+    """)
+
+    # 2. One cart line per (user, product)
+    op.execute("""
+        INSERT INTO cart_items (cart_id, product_id, quantity, created)
+        SELECT c.id, o.product_id, SUM(o.quantity), MIN(o.created)
+        FROM orders o
+        JOIN carts c ON c.user_id = o.user_id
+        WHERE o.status = 'Pending'
+          AND NOT EXISTS (
+              SELECT 1 FROM cart_items ci WHERE ci.cart_id = c.id AND ci.product_id = o.product_id
+          )
+        GROUP BY c.id, o.product_id
+    """)
+
+    # 3. Cart lines are no longer orders
+    op.execute("""
+        DELETE FROM payments
+        WHERE order_id IN (SELECT id FROM orders WHERE status = 'Pending')
+    """)
+    op.execute("DELETE FROM orders WHERE status = 'Pending'")
+
+    # 4. Every legacy single-product order gets its order line
+    op.execute("""
+        INSERT INTO order_items (order_id, product_id, quantity, unit_price, total)
+        SELECT o.id, o.product_id, o.quantity,
+               CASE WHEN o.quantity > 0 THEN o.total / o.quantity ELSE o.total END,
+               o.total
+        FROM orders o
+        WHERE o.product_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM order_items oi WHERE oi.order_id = o.id)
+    """)
+
+
+def downgrade():
+    # Cart lines go back to being 'Pending' orders
+    op.execute("""
+        INSERT INTO orders (user_id, product_id, quantity, total, status, created)
+        SELECT c.user_id, ci.product_id, ci.quantity, ci.quantity * p.price, 'Pending', ci.created
+        FROM cart_items ci
+        JOIN carts c ON c.id = ci.cart_id
+        JOIN products p ON p.id = ci.product_id
+    """)
+
+    op.drop_table('order_items')
+    op.drop_table('cart_items')
+    op.drop_table('carts')
+
+    # Multi-item orders placed since the upgrade have no single product and are lost here
+    op.execute("DELETE FROM payments WHERE order_id IN (SELECT id FROM orders WHERE product_id IS NULL)")
+    op.execute("DELETE FROM orders WHERE product_id IS NULL")
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.alter_column('product_id', existing_type=sa.Integer(), nullable=False)
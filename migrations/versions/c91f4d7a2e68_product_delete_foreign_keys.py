@@ -0,0 +1,53 @@
+"""product delete foreign keys
+
+Deleting a product removes it from carts and keeps past order lines
+(their product_id becomes NULL).
+
+Revision ID: c91f4d7a2e68
+Revises: b5d13e8f6a20
+Create Date: 2026-10-18 21:06:13.472190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c91f4d7a2e68'
+down_revision = 'b5d13e8f6a20'
+branch_labels = None
+depends_on = None
+
+
+def product_foreign_key(table):
+    """Name of the table's product_id -> products.id constraint (None when unnamed, e.g. SQLite)."""
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys(table):
+        if fk['referred_table'] == 'products' and fk['constrained_columns'] == ['product_id']:
+            return fk['name']
+    return None
+
+
+def replace_product_foreign_key(table, ondelete):
+    name = product_foreign_key(table)
+    with op.batch_alter_table(table) as batch_op:
+        if name:
+            batch_op.drop_constraint(name, type_='foreignkey')
+        batch_op.create_foreign_key(f'{table}_product_id_fkey', 'products', ['product_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    replace_product_foreign_key('cart_items', 'CASCADE')
+
+    with op.batch_alter_table('order_items') as batch_op:
+        batch_op.alter_column('product_id', existing_type=sa.Integer(), nullable=True)
+    replace_product_foreign_key('order_items', 'SET NULL')
+
+
+def downgrade():
+    # Lines of deleted products cannot point anywhere again
+    op.execute("DELETE FROM order_items WHERE product_id IS NULL")
+    replace_product_foreign_key('order_items', None)
+    with op.batch_alter_table('order_items') as batch_op:
+        batch_op.alter_column('product_id', existing_type=sa.Integer(), nullable=False)
+
+    replace_product_foreign_key('cart_items', None)
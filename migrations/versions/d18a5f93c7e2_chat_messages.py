@@ -0,0 +1,38 @@
+"""chat messages
+
+Revision ID: d18a5f93c7e2
+Revises: b62d7e04f9a3
+Create Date: 2026-10-18 16:20:44.581736
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd18a5f93c7e2'
+down_revision = 'b62d7e04f9a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # app.py runs db.create_all() on import, so the table may already exist
+    if sa.inspect(op.get_bind()).has_table('chat_messages'):
+        return
+
+    op.create_table(
+        'chat_messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.String(length=64), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_chat_messages_session_id', 'chat_messages', ['session_id', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_chat_messages_session_id', table_name='chat_messages')
+    op.drop_table('chat_messages')
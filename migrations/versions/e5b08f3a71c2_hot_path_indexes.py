@@ -0,0 +1,60 @@
+"""hot path indexes
+
+Revision ID: e5b08f3a71c2
+Revises: c47a1e5d9b30
+Create Date: 2026-10-18 14:21:09.835164
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b08f3a71c2'
+down_revision = 'c47a1e5d9b30'
+branch_labels = None
+depends_on = None
+
+# Keep in sync with the db.Index(...) entries in the models' __table_args__
+INDEXES = [
+    ('ix_products_created_id', 'products', ['created', 'id']),
+    ('ix_products_category_created', 'products', ['category', 'created']),
+    ('ix_products_price_id', 'products', ['price', 'id']),
+    ('ix_product_images_product_id', 'product_images', ['product_id', 'id']),
+    ('ix_orders_status_created', 'orders', ['status', 'created']),
+    ('ix_orders_user_created', 'orders', ['user_id', 'created']),
+    ('ix_orders_created', 'orders', ['created']),
+    ('ix_order_items_order_id', 'order_items', ['order_id']),
+    ('ix_order_items_product_id', 'order_items', ['product_id']),
+    ('ix_payments_order_id', 'payments', ['order_id']),
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        # CONCURRENTLY keeps the tables writable while the indexes build
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+                )
+        return
+
+    inspector = sa.inspect(bind)
+    for name, table, columns in INDEXES:
+        existing = {ix['name'] for ix in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, _table, _columns in reversed(INDEXES):
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        return
+
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
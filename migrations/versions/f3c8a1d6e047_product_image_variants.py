@@ -0,0 +1,32 @@
+"""product image variants
+
+Revision ID: f3c8a1d6e047
+Revises: d18a5f93c7e2
+Create Date: 2026-10-18 17:05:18.472930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a1d6e047'
+down_revision = 'd18a5f93c7e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Variants for existing images are generated by `flask process-images`
+    existing = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('product_images')}
+    with op.batch_alter_table('product_images') as batch_op:
+        if 'variants' not in existing:
+            batch_op.add_column(sa.Column('variants', sa.JSON(), nullable=True))
+        if 'placeholder' not in existing:
+            batch_op.add_column(sa.Column('placeholder', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('product_images') as batch_op:
+        batch_op.drop_column('placeholder')
+        batch_op.drop_column('variants')
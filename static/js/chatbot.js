@@ -98,31 +98,25 @@ class AmmaChatbot {
         this.showTypingIndicator();
 
         try {
-            const response = await fetch('/api/chat', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    message: messageText,
-                    session_id: this.sessionId
-                })
-            });
-
-            if (!response.ok) throw new Error('Network error');
-
-            const data = await response.json();
-            
-            // Artificial delay (optional) to make it feel more natural if API is too fast
-            // await new Promise(r => setTimeout(r, 500)); 
-
-            this.removeTypingIndicator();
-
-            // 3. Add Bot Message
-            const botMsg = {
-                text: data.message,
-                sender: 'amma',
-                time: this.getFormattedTime()
-            };
-            this.renderMessage(botMsg);
+            if (window.ReadableStream && window.TextDecoder) {
+                // 3. Stream the Bot Message in as it is generated
+                const response = await fetch('/api/chat/stream', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({
+                        message: messageText,
+                        session_id: this.sessionId
+                    })
+                });
+
+                if (!response.ok || !response.body) throw new Error('Network error');
+                await this.readStream(response.body.getReader());
+            } else {
+                // Old browsers: no streaming body, use the JSON endpoint
+                const data = await this.fetchReply(messageText);
+                this.removeTypingIndicator();
+                this.renderMessage({ text: data.message, sender: 'amma', time: this.getFormattedTime() });
+            }
 
         } catch (error) {
             console.error('Chat Error:', error);
@@ -138,6 +132,69 @@ class AmmaChatbot {
         }
     }
 
+    async fetchReply(messageText) {
+        const response = await fetch('/api/chat', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                message: messageText,
+                session_id: this.sessionId
+            })
+        });
+        if (!response.ok) throw new Error('Network error');
+        return response.json();
+    }
+
+    // Reads the Server-Sent Events of /api/chat/stream and grows one bot bubble as chunks arrive
+    async readStream(reader) {
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let text = '';
+        let bubble = null;
+
+        const show = (value) => {
+            if (!bubble) {
+                this.removeTypingIndicator();
+                bubble = this.renderMessage({ text: '', sender: 'amma', time: this.getFormattedTime() });
+            }
+            bubble.querySelector('.message-content').innerHTML = value.replace(/\n/g, '<br>');
+            this.scrollToBottom();
+        };
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            // Frames are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const frame = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                let event = 'message';
+                let data = '';
+                frame.split('\n').forEach(line => {
+                    if (line.startsWith('event:')) event = line.slice(6).trim();
+                    else if (line.startsWith('data:')) data += line.slice(5).trim();
+                });
+                if (!data) continue;
+                const payload = JSON.parse(data);
+
+                if (event === 'chunk') {
+                    text += payload.text;
+                    show(text);
+                } else if (event === 'fallback') {
+                    // Upstream failed (possibly partway): the backup answer replaces the partial one
+                    text = payload.text;
+                    show(text);
+                }
+            }
+        }
+
+        if (!bubble) throw new Error('Empty reply');
+    }
+
     renderMessage(msg) {
         const msgDiv = document.createElement('div');
         msgDiv.className = `message ${msg.sender}`;
@@ -154,6 +211,7 @@ class AmmaChatbot {
         
         this.messagesContainer.appendChild(msgDiv);
         this.scrollToBottom();
+        return msgDiv;
     }
 
     showTypingIndicator() {
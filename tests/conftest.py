@@ -0,0 +1,19 @@
+"""
+Shared test setup. app.py configures itself from the environment when it is imported,
+so the settings the tests rely on are fixed here, before any test module imports it:
+a throwaway SQLite primary plus a second SQLite file as the read replica.
+"""
+import os
+import sys
+import tempfile
+
+TEST_DB_DIR = tempfile.mkdtemp(prefix='ammas-kitchen-tests-')
+
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(TEST_DB_DIR, 'primary.db')
+os.environ['DATABASE_REPLICA_URL'] = 'sqlite:///' + os.path.join(TEST_DB_DIR, 'replica.db')
+os.environ.pop('DATABASE_REPORTS_URL', None)  # reports fall back to the replica's URL
+os.environ['APP_PRELOAD'] = '1'               # no outbox worker thread at import
+os.environ['MAIL_OUTBOX_WORKER'] = 'false'
+os.environ['SQL_INSTRUMENTATION'] = 'false'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,88 @@
+"""
+The /admin shell renders without touching orders or the rollup; its panels load separately.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import app
+from app import Order, User, db
+
+
+@pytest.fixture(scope='module')
+def customers():
+    """Five customers with one order each, placed today, on the bind the panels read (reports)."""
+    with app.app.app_context():
+        reports = db.engines['reports']
+    db.metadata.create_all(reports)
+    with Session(reports) as session:
+        # Ids clear of the primary's users: the request's session also holds the admin it checked
+        users = [User(id=1000 + n, name=f'Dashboard {n}', email=f'dashboard-{n}@example.invalid',
+                      phone=f'dash-{n}', password='-') for n in range(5)]
+        session.add_all(users)
+        session.flush()
+        session.add_all(Order(user_id=user.id, quantity=1, total=100, status='Shipped',
+                              address='Dashboard test', created=datetime.now()) for user in users)
+        session.commit()
+        yield [user.name for user in users]
+        session.execute(db.delete(Order).where(Order.address == 'Dashboard test'))
+        session.execute(db.delete(User).where(User.email.like('dashboard-%')))
+        session.commit()
+
+
+@pytest.fixture
+def admin_client():
+    client = app.app.test_client()
+    with app.app.app_context():
+        admin_id = User.query.filter_by(is_admin=True).first().id
+    with client.session_transaction() as session:
+        session['user_id'] = admin_id
+    return client
+
+
+@pytest.fixture
+def statements():
+    """SQL run by the test, from every bind."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    with app.app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', record)
+    yield seen
+    for engine in engines:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def test_shell_runs_no_dashboard_queries(admin_client, customers, statements):
+    response = admin_client.get('/admin?page=2&report_start=2026-01-01&report_end=2026-01-31')
+    assert response.status_code == 200
+    assert not [sql for sql in statements if 'orders' in sql or 'daily_sales' in sql]
+    html = response.get_data(as_text=True)
+    assert '/admin/panels/recent-orders?page=2' in html
+    assert 'report_start=2026-01-01' in html
+
+
+@pytest.mark.parametrize('panel', ['recent-orders', 'order-report'])
+def test_order_panels_load_customers_with_their_orders(admin_client, customers, statements, panel):
+    response = admin_client.get(f'/admin/panels/{panel}')
+    assert response.status_code == 200
+    html = response.get_data(as_text=True)
+    assert all(name in html for name in customers)
+    # Only the admin check selects from users: customers come joined to their orders, not one by one
+    assert len([sql for sql in statements if 'FROM users' in sql]) == 1
+
+
+def test_overview_panel(admin_client, customers):
+    response = admin_client.get('/admin/panels/overview')
+    assert response.status_code == 200
+    assert 'Customers' in response.get_data(as_text=True)
+
+
+def test_unknown_panel(admin_client):
+    assert admin_client.get('/admin/panels/nope').status_code == 404
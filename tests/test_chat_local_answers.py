@@ -0,0 +1,68 @@
+"""
+Product matching behind the chatbot's local answers (SuggestIndex.mentioned).
+
+    python -m pytest tests
+"""
+from collections import namedtuple
+
+import app
+
+Row = namedtuple('Row', 'id name')
+
+CATALOG = [
+    Row(1, 'Sambar Powder'),
+    Row(2, 'Rasam Powder'),
+    Row(3, 'Biryani Masala'),
+    Row(4, 'Murungai Keerai Podi'),
+    Row(5, 'Homemade Ghee'),
+    Row(6, 'Masoor Dal'),
+    Row(7, 'Dosa Mix'),
+    Row(8, 'Sambar Rice Mix'),
+]
+
+
+def build_index(rows=CATALOG):
+    index = app.SuggestIndex()
+    index._apply(set(), rows)
+    return index
+
+
+def mentioned(index, question):
+    return index.mentioned(question, ignore=app.CHAT_STOPWORDS, generic=app.CHAT_GENERIC_WORDS)
+
+
+def test_first_word_of_a_multi_word_name():
+    index = build_index()
+    assert mentioned(index, 'rasam price') == [2]
+    assert mentioned(index, 'how much is murungai keerai podi') == [4]
+    assert mentioned(index, 'is murungai available') == [4]
+
+
+def test_generic_word_breaks_a_tie():
+    index = build_index()
+    assert mentioned(index, 'sambar price') == [1, 8]
+    assert mentioned(index, 'price of sambar powder') == [1]
+    assert mentioned(index, 'sambar rice mix price') == [8]
+
+
+def test_generic_words_alone_name_nothing():
+    index = build_index()
+    assert mentioned(index, 'price of powder') == []
+    assert mentioned(index, 'masala price') == []
+
+
+def test_synonyms():
+    index = build_index()
+    assert mentioned(index, 'spinach powder price') == [4]
+    assert mentioned(index, 'biriyani masala cost') == []  # not a listed spelling
+    assert mentioned(index, 'briyani masala cost') == [3]
+    assert mentioned(index, 'nei price') == [5]
+    assert mentioned(index, 'masoor dhall stock') == [6]
+
+
+def test_removed_and_renamed_products():
+    index = build_index()
+    index._apply({2, 4}, [Row(4, 'Drumstick Leaf Podi')])
+    assert mentioned(index, 'rasam price') == []
+    assert mentioned(index, 'murungai keerai podi price') == []
+    assert mentioned(index, 'drumstick podi price') == [4]
@@ -0,0 +1,123 @@
+"""
+Read routing (RoutingSession, @route_reads) against two SQLite binds: the primary and a
+replica (conftest.py). The reports bind falls back to the replica's URL with its own pool.
+"""
+import pytest
+from flask import g, session
+from sqlalchemy import event
+
+import app
+from app import POOL_STATS, Product, db, route_reads, stick_to_primary
+
+
+@pytest.fixture(scope='module', autouse=True)
+def replica_schema():
+    with app.app.app_context():
+        db.metadata.create_all(db.engines['replica'])
+
+
+@pytest.fixture
+def executed():
+    """[(bind name, SQL)] of every statement run while the test is active."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((conn.engine.pool.logging_name or 'primary', statement.split()[0].upper()))
+
+    with app.app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', record)
+    yield statements
+    for engine in engines:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def in_request(f, bind=None, cookie=None):
+    """Runs `f` as a view (decorated with @route_reads(bind) when given); returns (result, response)."""
+    headers = {'Cookie': cookie} if cookie else {}
+    with app.app.test_request_context(headers=headers):
+        view = route_reads(bind)(f) if bind else f
+        try:
+            result = view()
+            response = stick_to_primary(app.app.response_class())
+            app.app.session_interface.save_session(app.app, session, response)
+        finally:
+            db.session.rollback()
+            db.session.remove()
+    return result, response
+
+
+def read_products():
+    return db.session.execute(db.select(Product.id)).all()
+
+
+@pytest.mark.parametrize('bind', ['replica', 'reports'])
+def test_routed_reads_use_their_bind(executed, bind):
+    in_request(read_products, bind)
+    assert executed == [(bind, 'SELECT')]
+
+
+def test_unrouted_reads_use_the_primary(executed):
+    in_request(read_products)
+    assert executed == [('primary', 'SELECT')]
+
+
+def test_writes_use_the_primary(executed):
+    def write():
+        db.session.add(Product(name='Routing test', mrp=10, price=9, stock=1, category='masalas'))
+        db.session.flush()
+        db.session.execute(db.update(Product).where(Product.id == -1).values(stock=Product.stock))
+
+    in_request(write, 'replica')
+    assert [bind for bind, _ in executed] == ['primary', 'primary']
+    assert [sql for _, sql in executed] == ['INSERT', 'UPDATE']
+
+
+def test_locking_reads_use_the_primary(executed):
+    in_request(lambda: db.session.execute(db.select(Product.id).with_for_update()).all(), 'replica')
+    assert executed == [('primary', 'SELECT')]
+
+
+def test_reads_after_a_commit_stay_on_the_primary(executed):
+    def write():
+        db.session.execute(db.update(Product).where(Product.id == -1).values(stock=Product.stock))
+        db.session.commit()
+
+    _, response = in_request(write, 'replica')
+    cookie = response.headers['Set-Cookie'].split(';')[0]
+    executed.clear()
+
+    # Same browser, next request: the replica may lag behind that commit
+    in_request(read_products, 'replica', cookie=cookie)
+    assert executed == [('primary', 'SELECT')]
+
+    # Reports are not read-your-writes: they keep their own bind
+    executed.clear()
+    in_request(read_products, 'reports', cookie=cookie)
+    assert executed == [('reports', 'SELECT')]
+
+
+def test_reads_without_a_recent_commit_use_the_replica(executed):
+    _, response = in_request(read_products, 'replica')
+    assert 'Set-Cookie' not in response.headers
+    assert executed == [('replica', 'SELECT')]
+
+
+def test_route_does_not_leak_into_the_next_request(executed):
+    in_request(read_products, 'replica')
+    executed.clear()
+    in_request(read_products)
+    assert executed == [('primary', 'SELECT')]
+    with app.app.test_request_context():
+        assert 'db_route' not in g
+
+
+def test_new_connections_are_counted():
+    with app.app.app_context():
+        engine = db.engines['replica']
+        engine.dispose()
+        before = POOL_STATS['replica'].stats()['connects']
+        with engine.connect() as connection:
+            connection.exec_driver_sql('SELECT 1')
+    assert POOL_STATS['replica'].stats()['connects'] == before + 1
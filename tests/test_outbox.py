@@ -0,0 +1,94 @@
+"""
+Outbox delivery (send_outbox_batch) against a local SMTP server (aiosmtpd).
+"""
+import socket
+
+import pytest
+
+import app
+from app import OutboxEmail, SMTPSession, db, queue_email, send_outbox_batch
+
+Controller = pytest.importorskip('aiosmtpd.controller').Controller
+
+
+class Inbox:
+    """aiosmtpd handler that keeps every message it accepts."""
+
+    def __init__(self):
+        self.envelopes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return '250 OK'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def inbox(monkeypatch):
+    handler = Inbox()
+    controller = Controller(handler, hostname='127.0.0.1', port=free_port())
+    controller.start()
+    monkeypatch.setattr(app, 'MAIL_SERVER', controller.hostname)
+    monkeypatch.setattr(app, 'MAIL_PORT', controller.port)
+    monkeypatch.setattr(app, 'MAIL_USE_TLS', False)
+    monkeypatch.setattr(app, 'MAIL_USE_AUTH', False)
+    monkeypatch.setattr(app, 'MAIL_SENDER', 'shop@example.invalid')
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture
+def outbox():
+    """An empty outbox in an app context; cleared again afterwards."""
+    with app.app.app_context():
+        OutboxEmail.query.delete()
+        db.session.commit()
+        yield
+        OutboxEmail.query.delete()
+        db.session.commit()
+
+
+def test_queued_messages_are_delivered(inbox, outbox):
+    queue_email('customer@example.invalid', 'Order confirmed', 'Thank you', '<p>Thank you</p>')
+    smtp = SMTPSession()
+    try:
+        assert send_outbox_batch(smtp) == 1
+    finally:
+        smtp.close()
+
+    [envelope] = inbox.envelopes
+    assert envelope.mail_from == 'shop@example.invalid'
+    assert envelope.rcpt_tos == ['customer@example.invalid']
+    assert b'Subject: Order confirmed' in envelope.content
+    outbox_email = OutboxEmail.query.one()
+    assert (outbox_email.status, outbox_email.attempts) == ('Sent', 1)
+    assert outbox_email.sent_at is not None
+
+
+def test_unreachable_server_is_retried_later(inbox, outbox, monkeypatch):
+    monkeypatch.setattr(app, 'MAIL_PORT', free_port())
+    queue_email('customer@example.invalid', 'Order confirmed', 'Thank you')
+    assert send_outbox_batch(SMTPSession()) == 1
+
+    outbox_email = OutboxEmail.query.one()
+    assert (outbox_email.status, outbox_email.attempts) == ('Queued', 1)
+    assert outbox_email.last_error
+    assert send_outbox_batch(SMTPSession()) == 0  # backing off
+    assert not inbox.envelopes
+
+
+def test_messages_stay_queued_without_smtp_settings(outbox, monkeypatch, capsys):
+    monkeypatch.setattr(app, 'MAIL_SENDER', None)
+    queue_email('customer@example.invalid', 'Reset your password', 'https://example.invalid/reset/secret-token')
+    assert send_outbox_batch(SMTPSession()) == 0
+
+    outbox_email = OutboxEmail.query.one()
+    assert (outbox_email.status, outbox_email.attempts, outbox_email.sent_at) == ('Queued', 0, None)
+    logged = capsys.readouterr().out
+    assert 'Reset your password' in logged and 'customer@example.invalid' in logged
+    assert 'secret-token' not in logged
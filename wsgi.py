@@ -0,0 +1,8 @@
+"""
+Production entry point:
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+app.py builds the Flask app, its models and routes on import.
+"""
+from app import app as application  # noqa: F401